@@ -2,6 +2,361 @@ import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 import re
+import io
+import math
+import os
+import hashlib
+from datetime import datetime
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+
+_T_SEP_RE = re.compile(rb'[;\s]+')
+_DATE_RE = re.compile(r'\d\d\.\d\d\.\d\d\d\d')
+_DATE_FMT = '%d.%m.%Y'
+# Upper limits of hours, minutes and seconds in the HH:MM:SS time.
+_HMS_LIMITS = np.array([24, 60, 60])
+
+# The date is written in the footer of the DLTS file, so only its tail is read.
+_D_TAIL_SIZE = 4096
+
+# Rows are written to hdf-files in pieces of about 1 MB (the default HDF5 chunk cache size).
+_HDF_CHUNK_BYTES = 1024 * 1024
+
+_CSV_CHUNK_ROWS = 100_000
+
+# Columns parsed from the text files by read_from_d_t.
+_D_T_COLUMNS = ['time', 'frequency_hz', 'dlts_v', 'temperature_k']
+
+_BS_ALLOWED = frozenset({1, 10, 100, 1000})
+_BS_ERR = 'bs value must be 1, 10, 100, 1000 or NaN'
+
+_LS_ALLOWED = frozenset({1, 2, 5, 10, 20, 50, 100, 200, 500, 1000})
+_LS_ERR = 'ls value must be 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000 or NaN'
+
+_INTEGRAL_TIME_ALLOWED = frozenset({0.3, 1, 3, 10, 30})
+_INTEGRAL_TIME_ERR = 'time value must be 0.3, 1, 3, 10, 30 or NaN'
+
+# Measured values are stored in single precision, it's far beyond the precision of the measurements.
+_FLOAT32_COLUMNS = ['frequency_hz', 'dlts_v', 'temperature_k', 'dlts_pf']
+# Columns read from csv-files as floats even if all their values are whole numbers or missing.
+_FLOAT_COLUMNS = _FLOAT32_COLUMNS + ['u1', 'ur', 'time_between_meas']
+
+_CATEGORICAL_DTYPES = {'bs': pd.CategoricalDtype(sorted(_BS_ALLOWED)),
+                       'ls': pd.CategoricalDtype(sorted(_LS_ALLOWED)),
+                       'integral_time': pd.CategoricalDtype(sorted(_INTEGRAL_TIME_ALLOWED))}
+# A missing specimen name is stored as a categorical without categories, whatever the missing value is.
+_NO_NAME_DTYPE = pd.CategoricalDtype(pd.Index([], dtype=object))
+
+_CATEGORICAL_ERRS = {'bs': _BS_ERR,
+                     'ls': _LS_ERR,
+                     'integral_time': _INTEGRAL_TIME_ERR}
+
+# Columns of the data attribute and their dtypes when pyarrow is available.
+_ARROW_SCHEMA = {'time': 'timestamp[ns][pyarrow]',
+                 'frequency_hz': 'float[pyarrow]',
+                 'dlts_v': 'float[pyarrow]',
+                 'temperature_k': 'float[pyarrow]',
+                 'dlts_pf': 'float[pyarrow]',
+                 'bs': _CATEGORICAL_DTYPES['bs'],
+                 'ls': _CATEGORICAL_DTYPES['ls'],
+                 'f_pulse': 'double[pyarrow]',
+                 'u1': 'double[pyarrow]',
+                 'ur': 'double[pyarrow]',
+                 'time_between_meas': 'double[pyarrow]',
+                 'integral_time': _CATEGORICAL_DTYPES['integral_time'],
+                 'specimen_name': pd.CategoricalDtype()}
+
+
+def _is_allowed(value, allowed_values):
+    """
+    Check that the value is one of the allowed values or NaN.
+    
+    Parameters
+    ----------
+    value : float
+        The value to check.
+    allowed_values : frozenset
+        The set of allowed finite values.
+    
+    Returns
+    -------
+    bool
+        True if the value is allowed, else False.
+    """
+    
+    # True == 1, but it isn't a sensitivity value and it can't be stored as a category.
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    
+    try:
+        return value in allowed_values or math.isnan(value)
+    except TypeError:
+        return False
+
+
+def _validate_bs(bs):
+    """
+    Check the bridge sensitivity value.
+    
+    Parameters
+    ----------
+    bs : float
+        The value to check.
+    
+    Returns
+    -------
+    float
+        The same value if it's allowed.
+    
+    Raises
+    ------
+    ValueError
+        If the bs contains wrong value.
+    """
+    
+    if _is_allowed(bs, _BS_ALLOWED):
+        return bs
+    raise ValueError(_BS_ERR)
+
+
+def _validate_ls(ls):
+    """
+    Check the selector sensitivity value.
+    
+    Parameters
+    ----------
+    ls : float
+        The value to check.
+    
+    Returns
+    -------
+    float
+        The same value if it's allowed.
+    
+    Raises
+    ------
+    ValueError
+        If the ls contains wrong value.
+    """
+    
+    if _is_allowed(ls, _LS_ALLOWED):
+        return ls
+    raise ValueError(_LS_ERR)
+
+
+def _validate_integral_time(time):
+    """
+    Check the time constant of the integrating circuit value.
+    
+    Parameters
+    ----------
+    time : float
+        The value to check.
+    
+    Returns
+    -------
+    float
+        The same value if it's allowed.
+    
+    Raises
+    ------
+    ValueError
+        If the time contains wrong value.
+    """
+    
+    if _is_allowed(time, _INTEGRAL_TIME_ALLOWED):
+        return time
+    raise ValueError(_INTEGRAL_TIME_ERR)
+
+
+# Columns written by the set_* methods and the validators of their values.
+_METADATA_COLUMNS = frozenset({'specimen_name', 'bs', 'ls', 'f_pulse', 'u1', 'ur', 
+                               'time_between_meas', 'integral_time'})
+_VALIDATORS = {'bs': _validate_bs,
+               'ls': _validate_ls,
+               'integral_time': _validate_integral_time}
+
+
+def _downcast(data):
+    """
+    Convert the measured values to single precision and 
+    the categorical values (bs, ls, integral_time, specimen_name) to categories.
+    
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        DataFrame with the experimental data.
+    
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with downcasted columns.
+    
+    Raises
+    ------
+    ValueError
+        If bs, ls or integral_time contains wrong value.
+    """
+    
+    # Columns without any values are read as the null type by pyarrow, which can't be cast 
+    # to categories, and as float64 from hdf-files, so they are converted to object first.
+    null_columns = [column for column, dtype in data.dtypes.items() 
+                    if (column in _CATEGORICAL_DTYPES or column == 'specimen_name')
+                    and not isinstance(dtype, pd.CategoricalDtype) and data[column].isna().all()]
+    if null_columns:
+        data = data.astype({column: object for column in null_columns})
+    
+    dtypes = {}
+    for column in _FLOAT32_COLUMNS:
+        if column in data:
+            dtypes[column] = 'float[pyarrow]' if isinstance(data[column].dtype, pd.ArrowDtype) else 'float32'
+    for column, dtype in _CATEGORICAL_DTYPES.items():
+        if column in data:
+            # Values that aren't categories become NaN silently, so they are checked first.
+            values = data[column]
+            if values.dtype != dtype and (values.notna() & ~values.isin(dtype.categories)).any():
+                raise ValueError(_CATEGORICAL_ERRS[column])
+            dtypes[column] = dtype
+    if 'specimen_name' in data:
+        if data['specimen_name'].isna().all():
+            dtypes['specimen_name'] = _NO_NAME_DTYPE
+        else:
+            dtypes['specimen_name'] = 'category'
+    
+    return data.astype(dtypes)
+
+
+def _to_arrow_backed(data):
+    """
+    Convert the columns of the DataFrame to the pyarrow-backed dtypes 
+    of _ARROW_SCHEMA, categorical columns are left as they are.
+    
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        DataFrame with the experimental data.
+    
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with pyarrow-backed columns.
+    """
+    
+    dtypes = {column: dtype for column, dtype in _ARROW_SCHEMA.items()
+              if column in data and isinstance(pd.api.types.pandas_dtype(dtype), pd.ArrowDtype)}
+    
+    return data.astype(dtypes)
+
+
+def _to_numpy_backed(data):
+    """
+    Convert pyarrow-backed columns of the DataFrame to NumPy dtypes.
+    PyTables can't write pyarrow-backed columns to hdf-files.
+    
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        DataFrame with the experimental data.
+    
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame with NumPy-backed columns only.
+    """
+    
+    columns = {}
+    for column, values in data.items():
+        if not isinstance(values.dtype, pd.ArrowDtype):
+            columns[column] = values
+        elif pd.api.types.is_datetime64_any_dtype(values.dtype):
+            columns[column] = values.astype('datetime64[ns]')
+        else:
+            columns[column] = pd.Series(values.to_numpy(na_value=np.nan), index=data.index)
+    
+    return pd.DataFrame(columns, index=data.index)
+
+
+def _write_hdf(data, fname, key):
+    """
+    Write the DataFrame to the hdf-file as a chunked table compressed with blosc:lz4,
+    replacing the dataset with the same key.
+    
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The DataFrame to write.
+    fname : str
+        The name of the hdf-file.
+    key : str
+        The key of the dataset in the hdf-file.
+    """
+    
+    data = _to_numpy_backed(data)
+    chunk_rows = max(1, _HDF_CHUNK_BYTES // (data.shape[1]*8))
+    
+    with pd.HDFStore(fname, complib='blosc:lz4', complevel=5) as store:
+        if key in store:
+            store.remove(key)
+        
+        if data.empty:
+            # PyTables doesn't write empty tables, and the fixed format can't store categories.
+            categorical_columns = data.select_dtypes('category').columns
+            store.put(key, data.astype({column: object for column in categorical_columns}), format='fixed')
+        else:
+            store.append(key,
+                         data,
+                         format='table',
+                         chunksize=chunk_rows,
+                         expectedrows=len(data))
+
+
+def _to_datetime(time, day):
+    """
+    Add the time of day in the HH:MM:SS format to the date.
+    
+    Parameters
+    ----------
+    time : pandas.Series
+        Series of strings containing the time of day in the HH:MM:SS format.
+    day : numpy.datetime64
+        The date of the measurement.
+    
+    Returns
+    -------
+    pandas.Series
+        Series of datetime64[ns] values.
+    
+    Raises
+    ------
+    ValueError
+        If the time isn't in the HH:MM:SS format or contains wrong values.
+    """
+    
+    hms = time.str.split(':', expand=True)
+    if hms.shape[1] != 3 or hms.isna().any(axis=None):
+        raise ValueError('time must be in the HH:MM:SS format')
+    
+    try:
+        hms = hms.astype('int64').to_numpy()
+    except ValueError:
+        raise ValueError('time must be in the HH:MM:SS format') from None
+    if ((hms < 0) | (hms >= _HMS_LIMITS)).any():
+        raise ValueError('time must be in the HH:MM:SS format with 0 <= HH < 24, 0 <= MM < 60, 0 <= SS < 60')
+    
+    seconds = hms[:, 0]*3600 + hms[:, 1]*60 + hms[:, 2]
+    
+    return pd.Series((day + seconds.astype('timedelta64[s]')).astype('datetime64[ns]'), index=time.index)
+
 
 class DataReader():
     """
@@ -31,15 +386,22 @@ class DataReader():
         'time_between_meas' - time between two measurements in seconds,
         'integral_time' - time constant of the integrating circuit in seconds,
         'specimen_name' - name of the specimen.
+        If pyarrow is installed, all non-categorical columns read from 
+        text, csv or hdf-files are pyarrow-backed.
+        Measured values are stored in single precision (float32), 
+        bs, ls, integral_time and specimen_name are stored as categories.
         
     Methods
     -------
     read_from_d_t(d_file_name, t_file_name, encoding='cp1251')
         Read data from text files with experimental data.
+    read_from_d_t_cached(d_file_name, t_file_name, encoding='cp1251', cache_path=None)
+        Read data from text files with experimental data, using 
+        the hdf-file with previously parsed data as a cache.
     read_from_csv(fname, encoding=None)
         Read data from csv-file created by an instance of 
         the ExperimentalDataReader class.
-    read_from_hdf(fname, key=None)
+    read_from_hdf(fname, key=None, start=None, stop=None)
         Read data from a binary file in the HDF5 format.
     set_specimen_name(specimen_name)
         Write the specimen name to the specimen_name 
@@ -65,6 +427,9 @@ class DataReader():
     set_integral_time(time=np.nan)
         Write the value of the time constant of the integrating circuit to 
         the specimen_name column of the self.data attribute.
+    set_metadata(**metadata)
+        Check and write several values to the corresponding columns 
+        of the self.data attribute at once.
     compute_dlts_pf()
         Convert values of DLTS-signal in volts to values in picofarads and 
         write them to the dlts_pf column of the self.data attribute.
@@ -82,19 +447,51 @@ class DataReader():
         Creates an instance of ExperimentalDataReader class with empty data attribute.
         """
 
-        self.data = pd.DataFrame(columns=['time', 
-                                          'frequency_hz', 
-                                          'dlts_v', 
-                                          'temperature_k',
-                                          'dlts_pf',
-                                          'bs',
-                                          'ls',
-                                          'f_pulse',
-                                          'u1',
-                                          'ur',
-                                          'time_between_meas',
-                                          'integral_time',
-                                          'specimen_name'])
+        self._scalars = {}
+        
+        if pyarrow is not None:
+            self.data = pd.DataFrame({column: pd.array([], dtype=dtype) 
+                                      for column, dtype in _ARROW_SCHEMA.items()})
+        else:
+            self.data = pd.DataFrame(columns=list(_ARROW_SCHEMA))
+    
+    
+    @property
+    def data(self):
+        """
+        The DataFrame containing the experimental data.
+        
+        The set_* methods only remember the scalar values, they are written to
+        the corresponding columns on the next access to this attribute, so 
+        a chain of setters doesn't allocate a new column on every call.
+        """
+        
+        if self._scalars:
+            # The values are dropped even if one of them can't be written, 
+            # otherwise every following access would fail again.
+            scalars, self._scalars = self._scalars, {}
+            for column, value in scalars.items():
+                if column == 'specimen_name':
+                    if pd.api.types.is_scalar(value) and pd.isna(value):
+                        self._data[column] = pd.Categorical.from_codes(np.full(len(self._data), -1, dtype=np.int8),
+                                                                       dtype=_NO_NAME_DTYPE)
+                    else:
+                        # There is only one specimen name, so all codes are 0.
+                        self._data[column] = pd.Categorical.from_codes(np.zeros(len(self._data), dtype=np.int8),
+                                                                       categories=[value])
+                elif column in _CATEGORICAL_DTYPES:
+                    self._data[column] = pd.Series(value, index=self._data.index, 
+                                                   dtype=_CATEGORICAL_DTYPES[column])
+                else:
+                    self._data[column] = value
+        
+        return self._data
+    
+    
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._scalars = {}
         
         
     def read_from_d_t(self, d_file_name, t_file_name, encoding='cp1251'):
@@ -112,6 +509,11 @@ class DataReader():
             Encoding of text files with experimental data. 
             Encodings for both files must be the same. 
             The default value is 'cp1251'.
+        
+        Raises
+        ------
+        ValueError
+            If the file with DLTS doesn't contain the date of the measurements.
         """
         
         dlts_data = pd.read_csv(d_file_name, 
@@ -123,37 +525,142 @@ class DataReader():
                                 header=None,
                                 names=['time', 'frequency_hz', 'dlts_v'])
         
-        temperature_data = pd.read_csv(t_file_name,
-                                       sep='[;\s]+',
-                                       encoding=encoding,
-                                       usecols=[0, 3],
-                                       header=None,
-                                       names=['time', 'temperature_k'],
-                                       skiprows=1,
-                                       engine='python')
+        # Separators in the temperature file are mixed (';' and runs of spaces),
+        # so they are collapsed to a single space to avoid the slow python engine.
+        with open(t_file_name, 'rb') as f:
+            t_buffer = io.BytesIO(b'\n'.join(_T_SEP_RE.sub(b' ', line).strip() for line in f))
+        
+        t_read_kwargs = dict(sep=' ',
+                             encoding=encoding,
+                             usecols=[0, 3],
+                             header=None,
+                             names=['time', 'temperature_k'],
+                             dtype={'time': str},
+                             skiprows=1)
+        
+        try:
+            temperature_data = pd.read_csv(t_buffer, engine='pyarrow', **t_read_kwargs)
+        except ImportError:
+            t_buffer.seek(0)
+            temperature_data = pd.read_csv(t_buffer, engine='c', low_memory=False, **t_read_kwargs)
+        
+        with open(d_file_name, 'rb') as f:
+            f.seek(0, io.SEEK_END)
+            f.seek(max(0, f.tell() - _D_TAIL_SIZE))
+            date_match = _DATE_RE.search(f.read().decode(encoding, errors='ignore'))
+            
+            if date_match is None:
+                f.seek(0)
+                date_match = _DATE_RE.search(f.read().decode(encoding, errors='ignore'))
         
-        with open(d_file_name, 'r') as f:
-            date_str = re.findall('\d\d\.\d\d\.\d\d\d\d', f.read())
+        if date_match is None:
+            raise ValueError(f'{d_file_name} does not contain a date in the dd.mm.yyyy format')
         
-        dlts_data['time'] = dlts_data.time + ' ' + date_str
-        dlts_data['time'] = pd.to_datetime(dlts_data.time, format='%H:%M:%S %d.%m.%Y')
+        day = np.datetime64(datetime.strptime(date_match.group(0), _DATE_FMT), 's')
         
-        temperature_data['time'] = temperature_data.time + ' ' + date_str
-        temperature_data['time'] = pd.to_datetime(temperature_data.time, format='%H:%M:%S %d.%m.%Y')
+        dlts_data['time'] = _to_datetime(dlts_data.time, day)
+        temperature_data['time'] = _to_datetime(temperature_data.time, day)
         
-        temperature_data.set_index('time', inplace=True)
-        temperature_data = temperature_data.resample('S').ffill()
+        # Each DLTS measurement gets the last temperature measured at or before it.
+        # merge_asof needs sorted keys, so the rows are put back in the order of the file afterwards.
+        merged_data = pd.merge_asof(dlts_data.reset_index().sort_values('time', kind='stable'),
+                                    temperature_data.sort_values('time', kind='stable'),
+                                    on='time',
+                                    direction='backward')
+        merged_data = merged_data.sort_values('index').drop(columns='index').reset_index(drop=True)
         
-        column_list = ['time', 'frequency_hz', 'dlts_v', 'temperature_k']
-        self.data[column_list] = dlts_data.merge(right=temperature_data, how='left', on='time')
+        self._set_d_t_columns(merged_data)
+    
+    
+    def _set_d_t_columns(self, d_t_data):
+        """
+        Write the columns parsed from the text files to the self.data attribute,
+        the other columns are kept.
+        
+        Parameters
+        ----------
+        d_t_data : pandas.DataFrame
+            The DataFrame with the time, frequency_hz, dlts_v and temperature_k columns.
+        """
+        
+        self.data[_D_T_COLUMNS] = d_t_data[_D_T_COLUMNS]
+        
+        if pyarrow is not None:
+            self.data = _to_arrow_backed(self.data)
+        
+        self.data = _downcast(self.data)
+    
+    
+    def read_from_d_t_cached(self, d_file_name, t_file_name, encoding='cp1251', cache_path=None):
+        """
+        Read data from text files with experimental data like read_from_d_t(),
+        but keep the parsed data in the hdf-file and read it from there on
+        subsequent calls.
+        
+        Only the columns parsed from the text files are cached, the other columns
+        of the self.data attribute are kept as read_from_d_t() does. The data is 
+        looked up in the cache by a key computed from the names, sizes and 
+        modification times of both files and the encoding, so changed files are 
+        parsed again and the outdated data of the same files is removed from the cache.
+        
+        Parameters
+        ----------
+        d_file_name : str 
+            String containing the name of the file with DLTS.
+        t_file_name : str
+            String containing the name of the file with temperature.
+        encoding : str
+            Encoding of text files with experimental data. 
+            Encodings for both files must be the same. 
+            The default value is 'cp1251'.
+        cache_path : str
+            String containing the name of the hdf-file used as a cache.
+            If cache_path=None, the name of the DLTS file with 
+            the '.cache.h5' extension is used. The default value is None.
+        """
+        
+        if cache_path is None:
+            cache_path = os.path.splitext(d_file_name)[0] + '.cache.h5'
+        
+        # The key consists of the hash of the file names and the hash of their versions,
+        # so the outdated entries of the same files can be found by the prefix.
+        path_hash = hashlib.blake2b(digest_size=8)
+        version_hash = hashlib.blake2b(encoding.encode(), digest_size=8)
+        for file_name in (d_file_name, t_file_name):
+            stat = os.stat(file_name)
+            path_hash.update(os.path.abspath(file_name).encode() + b'\0')
+            version_hash.update(f'{stat.st_mtime_ns} {stat.st_size}'.encode())
+        prefix = f'd_t_{path_hash.hexdigest()}_'
+        key = prefix + version_hash.hexdigest()
+        
+        d_t_data = None
+        if os.path.exists(cache_path):
+            with pd.HDFStore(cache_path, mode='r') as store:
+                if key in store:
+                    d_t_data = store[key]
+        
+        if d_t_data is not None:
+            self._set_d_t_columns(d_t_data)
+            return
+        
+        self.read_from_d_t(d_file_name, t_file_name, encoding=encoding)
+        
+        if os.path.exists(cache_path):
+            with pd.HDFStore(cache_path) as store:
+                for outdated_key in store.keys():
+                    if outdated_key.lstrip('/').startswith(prefix):
+                        store.remove(outdated_key)
+        
+        _write_hdf(self.data[_D_T_COLUMNS].reset_index(drop=True), cache_path, key)
     
     
     def read_from_csv(self, fname, encoding=None):
         """
         Read data from csv-file created by an instance of the ExperimentalDataReader class.
         
-        If encoding=None, the pd.read_csv() is called with default encoding, else
-        it is called with given encoding.
+        If encoding=None, the file is read with default encoding (utf-8), else
+        it is read with given encoding. If pyarrow is installed, the file is 
+        read by pyarrow.csv.read_csv(), else by pd.read_csv().
         
         Parameters
         ----------
@@ -164,18 +671,26 @@ class DataReader():
             The default value is None.
         """
         
-        if encoding is None:
-            self.data = pd.read_csv(fname)
+        if pyarrow is not None:
+            read_options = pyarrow.csv.ReadOptions(encoding=encoding or 'utf8')
+            column_types = {column: pyarrow.float64() for column in _FLOAT_COLUMNS}
+            column_types['time'] = pyarrow.timestamp('ns')
+            convert_options = pyarrow.csv.ConvertOptions(column_types=column_types)
+            table = pyarrow.csv.read_csv(fname, read_options=read_options, convert_options=convert_options)
+            self.data = _downcast(table.to_pandas(types_mapper=pd.ArrowDtype))
+        elif encoding is None:
+            self.data = _downcast(pd.read_csv(fname, dtype=dict.fromkeys(_FLOAT_COLUMNS, 'float64')))
         else:
-            self.data = pd.read_csv(fname, encoding=encoding)
+            self.data = _downcast(pd.read_csv(fname, encoding=encoding, dtype=dict.fromkeys(_FLOAT_COLUMNS, 'float64')))
     
     
-    def read_from_hdf(self, fname, key=None):
+    def read_from_hdf(self, fname, key=None, start=None, stop=None):
         """
         Read data from a binary file in the HDF5 format.
         
         If key=None, the pd.read_hdf() is called with default key, else
-        it is called with given key.
+        it is called with given key. If start or stop is given, only 
+        the rows from start to stop are read from the file.
         
         Parameters
         ----------
@@ -184,12 +699,22 @@ class DataReader():
         key : str
             Key of the dataset in the hdf-file with experimental data. 
             The default value is None.
+        start : int
+            Number of the first row to read. The default value is None.
+        stop : int
+            Number of the row to stop reading at. The default value is None.
         """
         
-        if key is None:
-            self.data = pd.read_hdf(fname)
-        else:
-            self.data = pd.read_hdf(fname, key)
+        with pd.HDFStore(fname, mode='r') as store:
+            if key is None:
+                data = pd.read_hdf(store, start=start, stop=stop)
+            else:
+                data = pd.read_hdf(store, key, start=start, stop=stop)
+        
+        if pyarrow is not None:
+            data = _to_arrow_backed(data)
+        
+        self.data = _downcast(data)
     
     
     def set_specimen_name(self, specimen_name):
@@ -203,7 +728,7 @@ class DataReader():
             String containing the name of the specimen.
         """
         
-        self.data.specimen_name = specimen_name
+        self._scalars['specimen_name'] = specimen_name
     
     
     def set_bs(self, bs=np.nan):
@@ -222,14 +747,7 @@ class DataReader():
             If the bs contains wrong value.
         """
         
-        allowed_values = [1, 10, 100, 1000, np.nan]
-        
-        error_message = 'bs value must be ' + ', '.join((str(_) for _ in allowed_values[:-1])) + ' or NaN'
-        
-        if bs in allowed_values:
-            self.data.bs = bs
-        else:
-            raise ValueError(error_message)
+        self._scalars['bs'] = _validate_bs(bs)
     
     
     def set_ls(self, ls=np.nan):
@@ -249,14 +767,7 @@ class DataReader():
             If the ls contains wrong value.
         """
         
-        allowed_values = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, np.nan]
-        
-        error_message = 'ls value must be ' + ', '.join((str(_) for _ in allowed_values[:-1])) + ' or NaN'
-        
-        if ls in allowed_values:
-            self.data.ls = ls
-        else:
-            raise ValueError(error_message)
+        self._scalars['ls'] = _validate_ls(ls)
     
     
     def set_f_pulse(self, f_pulse=np.nan):
@@ -269,7 +780,7 @@ class DataReader():
             The duration of the filling pulse in microseconds. The default value is np.nan.
         """
         
-        self.data.f_pulse = f_pulse
+        self._scalars['f_pulse'] = f_pulse
     
     
     def set_u1(self, u1=np.nan):
@@ -282,7 +793,7 @@ class DataReader():
             The level of filling pulse 1 in volts. The default value is np.nan.
         """
         
-        self.data.u1 = u1
+        self._scalars['u1'] = u1
     
     
     def set_ur(self, ur=np.nan):
@@ -295,7 +806,7 @@ class DataReader():
             The value of the reverse bias in volts. The default value is np.nan.
         """
         
-        self.data.ur = ur
+        self._scalars['ur'] = ur
         
         
     def set_time_between_meas(self, time=np.nan):
@@ -309,7 +820,7 @@ class DataReader():
             The value of time between measurements in seconds. The default value is np.nan.
         """
         
-        self.data.time_between_meas = time
+        self._scalars['time_between_meas'] = time
     
     
     def set_integral_time(self, time=np.nan):
@@ -330,14 +841,38 @@ class DataReader():
             If the time contains wrong value.
         """
         
-        allowed_values = [0.3, 1, 3, 10, 30, np.nan]
+        self._scalars['integral_time'] = _validate_integral_time(time)
+    
+    def set_metadata(self, **metadata):
+        """
+        Check and write several values to the corresponding columns of 
+        the self.data attribute at once, e.g. set_metadata(bs=1, ls=100, u1=-1.0).
+        All values are checked before any of them is written.
         
-        error_mesage = 'time value must be ' + ', '.join((str(_) for _ in allowed_values[:-1])) + ' or NaN'
+        Parameters
+        ----------
+        **metadata
+            Values of the specimen_name, bs, ls, f_pulse, u1, ur, 
+            time_between_meas and integral_time columns. The values are checked 
+            the same way as in the corresponding set_* methods.
         
-        if time in allowed_values:
-            self.data.integral_time = time
-        else:
-            raise ValueError(error_mesage)
+        Raises
+        ------
+        TypeError
+            If there is an unknown column name in the arguments.
+        ValueError
+            If bs, ls or integral_time contains wrong value.
+        """
+        
+        unknown_columns = set(metadata) - _METADATA_COLUMNS
+        if unknown_columns:
+            raise TypeError('unknown columns: ' + ', '.join(sorted(unknown_columns)))
+        
+        validated = {column: _VALIDATORS[column](value) if column in _VALIDATORS else value
+                     for column, value in metadata.items()}
+        
+        self._scalars.update(validated)
+    
     
     def compute_dlts_pf(self):
         """
@@ -345,12 +880,22 @@ class DataReader():
         write them to the dlts_pf column of the self.data attribute.
         """
         
-        self.data.dlts_pf = self.data.dlts_v / ((10 / self.data.bs)*(10000 / self.data.ls))
+        dlts_v = self.data.dlts_v.to_numpy(dtype='float64')
+        bs = self.data.bs.to_numpy(dtype='float64')
+        ls = self.data.ls.to_numpy(dtype='float64')
+        
+        # v / ((10 / bs) * (10000 / ls)) is computed as v * bs * ls / 1e5.
+        if numexpr is not None:
+            dlts_pf = numexpr.evaluate('dlts_v * bs * ls / 1e5')
+        else:
+            dlts_pf = dlts_v * bs * ls / 1e5
+        
+        self.data['dlts_pf'] = dlts_pf.astype(np.float32)
 
     
     def to_csv(self, fname):
         """
-        Write the self.data DataFrame to the csv-file.
+        Write the self.data DataFrame to the csv-file in chunks.
         
         Parameters
         ----------
@@ -358,12 +903,16 @@ class DataReader():
             The name of the csv-file.
         """
         
-        self.data.to_csv(fname, index=False)
+        self.data.to_csv(fname, index=False, chunksize=_CSV_CHUNK_ROWS)
     
     
     def to_hdf(self, fname, key='data'):
         """
         Write the self.data DataFrame to the binary file in the HDF5 format.
+        The data is written as a chunked table compressed with blosc:lz4 
+        (an empty DataFrame is written in the fixed format). If the file 
+        already contains a dataset with the same key, the dataset is replaced, 
+        other datasets in the file are kept.
         
         Parameters
         ----------
@@ -373,7 +922,7 @@ class DataReader():
             The key of the dataset in the hdf-file. The default value is 'data'.
         """
         
-        self.data.to_hdf(fname, key)
+        _write_hdf(self.data, fname, key)
         
     
     def get_plot(self):
@@ -386,27 +935,26 @@ class DataReader():
         ax : `.axes.Axes` or array of Axes
         """
         
+        temperature_k = self.data.temperature_k.to_numpy(dtype='float64', na_value=np.nan)
+        
+        t_min, t_max = np.nanmin(temperature_k), np.nanmax(temperature_k)
+        
         fig, ax = plt.subplots(2, 1, figsize=(10, 10), gridspec_kw={'height_ratios': [4, 1]})
         
-        self.data.plot(ax=ax[0],
-                       x='frequency_hz',
-                       y='dlts_pf',
-                       kind='scatter',
-                       logx=True,
-                       xlabel='Frequency, Hz',
-                       ylabel='DLTS, pF',
-                       grid=True,
-                      )
-        
-        self.data.plot(ax=ax[1],
-                       x='frequency_hz',
-                       y='temperature_k',
-                       kind='scatter',
-                       logx=True,
-                       xlabel='Frequency, Hz',
-                       ylabel='Temperature, K',
-                       grid=True,
-                       ylim=(np.round(self.data.temperature_k.min() - 1, 0), np.round(self.data.temperature_k.max() + 1, 0))
-                      )
+        frequency_hz = self.data.frequency_hz.to_numpy(dtype='float64', na_value=np.nan)
+        dlts_pf = self.data.dlts_pf.to_numpy(dtype='float64', na_value=np.nan)
+        
+        ax[0].scatter(frequency_hz, dlts_pf, s=20)
+        ax[0].set_xscale('log')
+        ax[0].set_xlabel('Frequency, Hz')
+        ax[0].set_ylabel('DLTS, pF')
+        ax[0].grid(True)
+        
+        ax[1].scatter(frequency_hz, temperature_k, s=20)
+        ax[1].set_xscale('log')
+        ax[1].set_xlabel('Frequency, Hz')
+        ax[1].set_ylabel('Temperature, K')
+        ax[1].set_ylim(np.round(t_min - 1, 0), np.round(t_max + 1, 0))
+        ax[1].grid(True)
         
         return fig, ax
\ No newline at end of file